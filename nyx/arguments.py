@@ -269,5 +269,5 @@ def missing_event_types():
     return []  # GETINFO query failed
 
   tor_event_types = response.split(' ')
-  recognized_types = TOR_EVENT_TYPES.values()
+  recognized_types = set(TOR_EVENT_TYPES.values())
   return list(filter(lambda x: x not in recognized_types, tor_event_types))
@@ -27,6 +27,8 @@ if we want Windows support in the future too.
   is_wide_characters_supported - checks if curses supports wide character
 
   draw - renders subwindow that can be drawn into
+  partial_draw - renders over a subwindow without first clearing it
+  batch_draws - defers terminal updates so several draws are sent together
 
   Subwindow - subwindow that can be drawn within
     |- addstr - draws a string
@@ -99,6 +101,7 @@ from nyx import msg, log
 
 CURSES_SCREEN = None
 CURSES_LOCK = threading.RLock()
+BATCHED_DRAWS = 0  # terminal updates are deferred while this is positive
 
 # Text colors and attributes. These are *very* commonly used so including
 # shorter aliases (so they can be referenced as just GREEN or BOLD).
@@ -496,6 +499,27 @@ def draw(func, left = 0, top = 0, width = None, height = None, background = None
   :param nyx.curses.Color background: background color, unset if **None**
   """
 
+  _draw(func, left, top, width, height, background, True)
+
+
+def partial_draw(func, left = 0, top = 0, width = None, height = None, background = None):
+  """
+  Renders over a subwindow's present content. Unlike
+  :func:`~nyx.curses.draw` this doesn't erase the subwindow first, so only
+  what the draw function writes is changed on screen.
+
+  :param function func: draw function for rendering the subwindow
+  :param int left: left position of the panel
+  :param int top: top position of the panel
+  :param int width: panel width, uses all available space if **None**
+  :param int height: panel height, uses all available space if **None**
+  :param nyx.curses.Color background: background color, unset if **None**
+  """
+
+  _draw(func, left, top, width, height, background, False)
+
+
+def _draw(func, left, top, width, height, background, erase):
   with CURSES_LOCK:
     dimensions = screen_size()
     subwindow_width = max(0, dimensions.width - left)
@@ -508,13 +532,52 @@ def draw(func, left = 0, top = 0, width = None, height = None, background = None
       subwindow_height = min(height, subwindow_height)
 
     curses_subwindow = CURSES_SCREEN.subwin(subwindow_height, subwindow_width, top, left)
-    curses_subwindow.erase()
+
+    if erase:
+      curses_subwindow.erase()
 
     if background:
       curses_subwindow.bkgd(' ', curses_attr(background, HIGHLIGHT))
 
     func(_Subwindow(subwindow_width, subwindow_height, curses_subwindow))
-    curses_subwindow.refresh()
+    curses_subwindow.noutrefresh()
+
+    if not BATCHED_DRAWS:
+      curses.doupdate()
+
+
+def batch_draws():
+  """
+  Defers sending draws to the terminal until the end of this context, so
+  multiple subwindows are presented with a single update. Curses only sends
+  the portions of the screen that have changed. This is used as follows...
+
+  ::
+
+    with nyx.curses.batch_draws():
+      nyx.curses.draw(...)
+      nyx.curses.draw(...)
+  """
+
+  class _Wrapper(object):
+    def __enter__(self):
+      global BATCHED_DRAWS
+
+      CURSES_LOCK.acquire()
+      BATCHED_DRAWS += 1
+
+    def __exit__(self, exit_type, value, traceback):
+      global BATCHED_DRAWS
+
+      BATCHED_DRAWS -= 1
+
+      try:
+        if not BATCHED_DRAWS:
+          curses.doupdate()
+      finally:
+        CURSES_LOCK.release()
+
+  return _Wrapper()
 
 
 class _Subwindow(object):
@@ -569,10 +632,19 @@ class _Subwindow(object):
     orig_y = y
 
     while msg:
-      draw_msg, msg = stem.util.str_tools.crop(msg, width - x, None, ending = None, get_remainder = True)
+      if len(msg) <= width - x:
+        draw_msg, msg = msg, ''
+      else:
+        # break on the last space that fits, same as crop() without a minimum
+        # word length but without its overhead
+
+        wordbreak = msg.rfind(' ', 0, width - x + 1)
+        draw_msg = msg[:wordbreak].rstrip() if wordbreak > 0 else ''
 
-      if not draw_msg:
-        draw_msg, msg = stem.util.str_tools.crop(msg, width - x), ''  # first word is longer than the line
+        if draw_msg:
+          msg = msg[len(draw_msg):]
+        else:
+          draw_msg, msg = stem.util.str_tools.crop(msg, width - x), ''  # first word is longer than the line
 
       x = self.addstr(x, y, draw_msg, *attr)
 
@@ -643,6 +715,7 @@ class KeyInput(object):
 
   def __init__(self, key):
     self._key = key  # pressed key as an integer
+    self._lowercase_char = chr(key).lower() if 0 <= key < 256 else None
 
   def match(self, *keys):
     """
@@ -656,7 +729,7 @@ class KeyInput(object):
         if self._key == SPECIAL_KEYS[key]:
           return True
       elif len(key) == 1:
-        if self._key in (ord(key.lower()), ord(key.upper())):
+        if self._lowercase_char == key.lower():
           return True
       else:
         raise ValueError("%s wasn't among our recognized key codes" % key)
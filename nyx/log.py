@@ -198,11 +198,29 @@ def listen_for_events(listener, events):
   controller = nyx.tor_controller()
   controller.remove_event_listener(listener)
 
-  for event_type in list(tor_events):
-    try:
-      controller.add_event_listener(listener, event_type)
-    except stem.ProtocolError:
-      tor_events.remove(event_type)
+  # drop anything tor tells us it doesn't support so it won't reject our request
+
+  supported_events = controller.get_info('events/names', None)
+
+  if supported_events:
+    tor_events.intersection_update(supported_events.split())
+
+  if not tor_events:
+    return sorted(nyx_events)
+
+  # Each add_event_listener() call issues a SETEVENTS, so try attaching to
+  # everything at once and only go event by event if tor rejects some.
+
+  try:
+    controller.add_event_listener(listener, *tor_events)
+  except stem.ProtocolError:
+    controller.remove_event_listener(listener)
+
+    for event_type in list(tor_events):
+      try:
+        controller.add_event_listener(listener, event_type)
+      except stem.ProtocolError:
+        tor_events.remove(event_type)
 
   return sorted(tor_events.union(nyx_events))
 
@@ -318,6 +336,8 @@ class LogEntry(object):
     self.is_duplicate = False
     self.duplicates = None
 
+    self._matched_common_messages = None
+
   @lru_cache()
   def is_duplicate_of(self, entry):
     """
@@ -337,18 +357,33 @@ class LogEntry(object):
       if self.message[:self.message.find('runtime:')] == entry.message[:self.message.find('runtime:')]:
         return True
 
-    for common_msg in _common_log_messages().get(self.type, []):
-      # if it starts with an asterisk then check the whole message rather
-      # than just the start
+    return not self._common_messages().isdisjoint(entry._common_messages())
+
+  def _common_messages(self):
+    """
+    Provides the common log messages (see dedup.cfg) that we match. This is
+    determined once so deduplication against each entry in a group is just a
+    set comparison rather than a scan of every pattern.
+
+    :returns: **frozenset** of the common messages we match
+    """
+
+    if self._matched_common_messages is None:
+      matches = []
+
+      for common_msg in _common_log_messages().get(self.type, []):
+        # if it starts with an asterisk then check the whole message rather
+        # than just the start
+
+        if common_msg[0] == '*':
+          if common_msg[1:] in self.message:
+            matches.append(common_msg)
+        elif self.message.startswith(common_msg):
+          matches.append(common_msg)
 
-      if common_msg[0] == '*':
-        if common_msg[1:] in self.message and common_msg[1:] in entry.message:
-          return True
-      else:
-        if self.message.startswith(common_msg) and entry.message.startswith(common_msg):
-          return True
+      self._matched_common_messages = frozenset(matches)
 
-    return False
+    return self._matched_common_messages
 
   def day_count(self):
     """
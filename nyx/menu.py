@@ -11,7 +11,6 @@ import nyx.controller
 import nyx.curses
 import nyx.popups
 import nyx.panel.graph
-import nyx.controller
 import nyx.tracker
 
 import stem
@@ -21,6 +20,12 @@ from nyx import tor_controller
 from nyx.curses import RED, WHITE, NORMAL, BOLD, UNDERLINE
 from stem.util import conf, str_tools
 
+try:
+  # added in python 3.2
+  from functools import lru_cache
+except ImportError:
+  from stem.util.lru_cache import lru_cache
+
 CONFIG = conf.config_dict('nyx', {
   'features.log.showDuplicateEntries': False,
 })
@@ -37,19 +42,23 @@ def make_menu():
 
   control = nyx.controller.get_controller()
 
+  page_menus = {
+    'graph': ('Graph', make_graph_menu),
+    'log': ('Log', make_log_menu),
+    'connections': ('Connections', make_connections_menu),
+    'configuration': ('Configuration', make_configuration_menu),
+    'torrc': ('Torrc', make_torrc_menu),
+  }
+
+  # Page submenus are only constructed when the user navigates to them, so
+  # opening the menu doesn't pay for submenus that are never shown.
+
   for page_panel in control.get_display_panels():
-    if page_panel.get_name() == 'graph':
-      base_menu.add(make_graph_menu(page_panel))
-    elif page_panel.get_name() == 'log':
-      base_menu.add(make_log_menu(page_panel))
-    elif page_panel.get_name() == 'connections':
-      base_menu.add(make_connections_menu(page_panel))
-    elif page_panel.get_name() == 'configuration':
-      base_menu.add(make_configuration_menu(page_panel))
-    elif page_panel.get_name() == 'torrc':
-      base_menu.add(make_torrc_menu(page_panel))
-
-  base_menu.add(make_help_menu())
+    if page_panel.get_name() in page_menus:
+      label, factory = page_menus[page_panel.get_name()]
+      base_menu.add_lazy(label, functools.partial(factory, page_panel))
+
+  base_menu.add_lazy('Help', make_help_menu)
 
   return base_menu
 
@@ -100,7 +109,7 @@ def make_view_menu():
 
     for i in range(control.get_page_count()):
       page_panels = control.get_display_panels(page_number = i)
-      label = ' / '.join([str_tools._to_camel_case(panel.get_name()) for panel in page_panels])
+      label = ' / '.join([_to_camel_case(panel.get_name()) for panel in page_panels])
 
       view_menu.add(SelectionMenuItem(label, page_group, i))
 
@@ -111,7 +120,7 @@ def make_view_menu():
     color_menu.add(SelectionMenuItem('All', color_group, None))
 
     for color in nyx.curses.Color:
-      color_menu.add(SelectionMenuItem(str_tools._to_camel_case(color), color_group, color))
+      color_menu.add(SelectionMenuItem(_to_camel_case(color), color_group, color))
 
     view_menu.add(color_menu)
 
@@ -154,7 +163,7 @@ def make_graph_menu(graph_panel):
   available_stats.sort()
 
   for stat_key in ['None'] + available_stats:
-    label = str_tools._to_camel_case(stat_key, divider = ' ')
+    label = _to_camel_case(stat_key, divider = ' ')
     stat_key = None if stat_key == 'None' else stat_key
     graph_menu.add(SelectionMenuItem(label, stat_group, stat_key))
 
@@ -307,6 +316,16 @@ def make_torrc_menu(torrc_panel):
   return torrc_menu
 
 
+@lru_cache()
+def _to_camel_case(label, divider = '_'):
+  """
+  Memoized str_tools._to_camel_case(). Our labels are panel, stat, and color
+  names so these are the same each time the menu's made.
+  """
+
+  return str_tools._to_camel_case(label, divider)
+
+
 class MenuCursor:
   """
   Tracks selection and key handling in the menu.
@@ -375,9 +394,10 @@ def show_menu():
 
   def _render(subwindow):
     x = 0
+    selected_submenu = selection_hierarchy[1]
 
     for top_level_item in menu.get_children():
-      if top_level_item == selection_hierarchy[1]:
+      if top_level_item is selected_submenu:
         selection_left[0] = x
         attr = UNDERLINE
       else:
@@ -393,20 +413,32 @@ def show_menu():
 
     menu = make_menu()
     cursor = MenuCursor(menu.get_children()[0].get_children()[0])
+    last_selection, is_partial_draw = None, False
 
     while not cursor.is_done():
       selection_hierarchy = cursor.get_selection().get_hierarchy()
 
-      # provide a message saying how to close the menu
+      with nyx.curses.batch_draws():
+        # If the selection moved within the same submenu then only the rows it
+        # moved between need to be repainted. This is unless either is cut
+        # off by the bottom of the screen, in which case we redraw it all.
+
+        if not is_partial_draw or not _draw_selection_change(selection_hierarchy[-2], last_selection, selection_hierarchy[-1]):
+          # provide a message saying how to close the menu
+
+          nyx.controller.show_message('Press m or esc to close the menu.', BOLD)
+          nyx.curses.draw(_render, height = 1, background = RED)
+          _draw_submenu(cursor, 1, 1, selection_left[0])
 
-      nyx.controller.show_message('Press m or esc to close the menu.', BOLD)
-      nyx.curses.draw(_render, height = 1, background = RED)
-      _draw_submenu(cursor, 1, 1, selection_left[0])
-      cursor.handle_key(nyx.curses.key_input())
+      last_selection = cursor.get_selection()
+      key = nyx.curses.key_input()
+      cursor.handle_key(key)
+
+      is_partial_draw = key.match('up', 'down') and cursor.get_selection().get_parent() == last_selection.get_parent()
 
       # redraws the rest of the interface if we're rendering on it again
 
-      if not cursor.is_done():
+      if not cursor.is_done() and not is_partial_draw:
         nyx.controller.get_controller().redraw()
 
   nyx.controller.show_message()
@@ -425,31 +457,60 @@ def _draw_submenu(cursor, level, top, left):
   submenu = selection_hierarchy[level]
   selection = selection_hierarchy[level + 1]
 
-  # gets the size of the prefix, middle, and suffix columns
-
-  all_label_sets = [entry.get_label() for entry in submenu.get_children()]
-  prefix_col_size = max([len(entry[0]) for entry in all_label_sets])
-  middle_col_size = max([len(entry[1]) for entry in all_label_sets])
-  suffix_col_size = max([len(entry[2]) for entry in all_label_sets])
-
-  # formatted string so we can display aligned menu entries
+  children = submenu.get_children()
+  label_format, menu_width = submenu.get_layout()
+  selection_index = selection._sibling_index
 
-  label_format = ' %%-%is%%-%is%%-%is ' % (prefix_col_size, middle_col_size, suffix_col_size)
-  menu_width = len(label_format % ('', '', ''))
-  selection_top = submenu.get_children().index(selection) if selection in submenu.get_children() else 0
+  if selection_index is not None and selection_index < len(children) and children[selection_index] is selection:
+    selection_top = selection_index
+  else:
+    selection_top = 0
 
   def _render(subwindow):
-    for y, menu_item in enumerate(submenu.get_children()):
+    for y, menu_item in enumerate(children):
       if menu_item == selection:
         subwindow.addstr(0, y, label_format % menu_item.get_label(), WHITE, BOLD)
       else:
         subwindow.addstr(0, y, label_format % menu_item.get_label())
 
   with nyx.curses.CURSES_LOCK:
-    nyx.curses.draw(_render, top = top, left = left, width = menu_width, height = len(submenu.get_children()), background = RED)
+    nyx.curses.draw(_render, top = top, left = left, width = menu_width, height = len(children), background = RED)
+    submenu._last_drawn_position = (top, left)
     _draw_submenu(cursor, level + 1, top + selection_top, left + menu_width)
 
 
+def _draw_selection_change(submenu, old_selection, new_selection):
+  """
+  Repaints the rows of a submenu we've already drawn whose selection state
+  has changed. This provides False without drawing anything if either row is
+  below the bottom of the screen, and True otherwise.
+
+  Arguments:
+    submenu       - submenu containing the selections
+    old_selection - previously selected menu item
+    new_selection - presently selected menu item
+  """
+
+  top, left = submenu._last_drawn_position
+  label_format, menu_width = submenu.get_layout()
+  rows = [top + menu_item._sibling_index for menu_item in (old_selection, new_selection)]
+
+  if max(rows) >= nyx.curses.screen_size().height:
+    return False
+
+  def _render(subwindow, menu_item):
+    if menu_item == new_selection:
+      subwindow.addstr(0, 0, label_format % menu_item.get_label(), WHITE, BOLD)
+    else:
+      subwindow.addstr(0, 0, label_format % menu_item.get_label())
+
+  with nyx.curses.CURSES_LOCK:
+    for row, menu_item in zip(rows, (old_selection, new_selection)):
+      nyx.curses.partial_draw(functools.partial(_render, menu_item = menu_item), top = row, left = left, width = menu_width, height = 1, background = RED)
+
+  return True
+
+
 class MenuItem():
   """
   Option in a drop-down menu.
@@ -459,6 +520,8 @@ class MenuItem():
     self._label = label
     self._callback = callback
     self._parent = None
+    self._hierarchy = None  # cached result of get_hierarchy()
+    self._sibling_index = None  # our position within our parent's children
 
   def get_label(self):
     """
@@ -480,22 +543,22 @@ class MenuItem():
     Provides a list with all of our parents, up to the root.
     """
 
-    my_hierarchy = [self]
-    while my_hierarchy[-1].get_parent():
-      my_hierarchy.append(my_hierarchy[-1].get_parent())
+    if self._hierarchy is None:
+      my_hierarchy = [self]
+      while my_hierarchy[-1].get_parent():
+        my_hierarchy.append(my_hierarchy[-1].get_parent())
+
+      my_hierarchy.reverse()
+      self._hierarchy = my_hierarchy
 
-    my_hierarchy.reverse()
-    return my_hierarchy
+    return self._hierarchy
 
   def get_root(self):
     """
     Provides the base submenu we belong to.
     """
 
-    if self._parent:
-      return self._parent.get_root()
-    else:
-      return self
+    return self.get_hierarchy()[0]
 
   def select(self):
     """
@@ -526,6 +589,13 @@ class MenuItem():
 
     return self._get_sibling(-1)
 
+  def _clear_hierarchy(self):
+    """
+    Discards our cached hierarchy, which is needed when our parent changes.
+    """
+
+    self._hierarchy = None
+
   def _get_sibling(self, offset):
     """
     Provides our sibling with a given index offset from us, raising a
@@ -537,16 +607,16 @@ class MenuItem():
 
     if self._parent:
       my_siblings = self._parent.get_children()
+      my_index = self._sibling_index
 
-      try:
-        my_index = my_siblings.index(self)
-        return my_siblings[(my_index + offset) % len(my_siblings)]
-      except ValueError:
+      if my_index is None or my_index >= len(my_siblings) or my_siblings[my_index] is not self:
         # We expect a bidirectional references between submenus and their
         # children. If we don't have this then our menu's screwed up.
 
-        msg = "The '%s' submenu doesn't contain '%s' (children: '%s')" % (self, self._parent, "', '".join(my_siblings))
+        msg = "The '%s' submenu doesn't contain '%s' (children: '%s')" % (self._parent, self, "', '".join(map(str, my_siblings)))
         raise ValueError(msg)
+
+      return my_siblings[(my_index + offset) % len(my_siblings)]
     else:
       raise ValueError("Menu option '%s' doesn't have a parent" % self)
 
@@ -562,6 +632,9 @@ class Submenu(MenuItem):
   def __init__(self, label):
     MenuItem.__init__(self, label, None)
     self._children = []
+    self._child_factories = []  # pending functions that provide our children
+    self._layout = None  # cached result of get_layout()
+    self._last_drawn_position = None  # (top, left) where we were last drawn
 
   def get_label(self):
     """
@@ -584,21 +657,80 @@ class Submenu(MenuItem):
       raise ValueError("Menu option '%s' already has a parent" % menu_item)
     else:
       menu_item._parent = self
+      menu_item._sibling_index = len(self._children)
+      menu_item._clear_hierarchy()
       self._children.append(menu_item)
+      self._layout = None
+
+  def add_lazy(self, label, factory):
+    """
+    Adds a submenu whose contents aren't constructed until they're first
+    requested. This provides back the placeholder submenu that was added.
+
+    Arguments:
+      label   - label of the submenu
+      factory - function that provides a Submenu with the contents to use
+    """
+
+    placeholder = Submenu(label)
+    placeholder._child_factories.append(factory)
+    self.add(placeholder)
+    return placeholder
+
+  def _clear_hierarchy(self):
+    MenuItem._clear_hierarchy(self)
+
+    for menu_item in self._children:
+      menu_item._clear_hierarchy()
 
   def get_children(self):
     """
-    Provides the menu and submenus we contain.
+    Provides the menu and submenus we contain. This is our underlying list, so
+    callers should not modify it.
+    """
+
+    if self._child_factories:
+      factories, self._child_factories = self._child_factories, []
+
+      for factory in factories:
+        for menu_item in factory().get_children():
+          menu_item._parent = None
+          self.add(menu_item)
+
+    return self._children
+
+  def get_layout(self):
+    """
+    Provides a tuple with the format string for aligning our children's labels
+    and the width of the resulting menu. Label widths don't vary with state
+    (selection prefixes are always four characters) so this is only
+    determined once.
     """
 
-    return list(self._children)
+    children = self.get_children()
+
+    if self._layout is None:
+      # gets the size of the prefix, middle, and suffix columns
+
+      all_label_sets = [entry.get_label() for entry in children]
+      prefix_col_size = max([len(entry[0]) for entry in all_label_sets])
+      middle_col_size = max([len(entry[1]) for entry in all_label_sets])
+      suffix_col_size = max([len(entry[2]) for entry in all_label_sets])
+
+      # formatted string so we can display aligned menu entries
+
+      label_format = ' %%-%is%%-%is%%-%is ' % (prefix_col_size, middle_col_size, suffix_col_size)
+      menu_width = prefix_col_size + middle_col_size + suffix_col_size + 2
+      self._layout = (label_format, menu_width)
+
+    return self._layout
 
   def is_empty(self):
     """
     True if we have no children, false otherwise.
     """
 
-    return not bool(self._children)
+    return not bool(self.get_children())
 
   def select(self):
     return False
@@ -266,7 +266,7 @@ class Panel(object):
     if not self.visible or HALT_ACTIVITY:
       return
 
-    if self.panel_name in ('header'):
+    if self.panel_name == 'header':
       height = self.get_height() if self.get_height() != -1 else None
       width = self.get_width() if self.get_width() != -1 else None
 
@@ -415,12 +415,25 @@ class Panel(object):
     orig_y = y
 
     while msg:
-      draw_msg, msg = str_tools.crop(msg, width - x, None, ending = None, get_remainder = True)
+      if len(msg) <= width - x:
+        draw_msg, msg = msg, ''
+      else:
+        # break on the last space that fits, same as crop() without a minimum
+        # word length but without its overhead
+
+        wordbreak = msg.rfind(' ', 0, width - x + 1)
+        draw_msg = msg[:wordbreak].rstrip() if wordbreak > 0 else ''
 
-      if not draw_msg:
-        draw_msg, msg = str_tools.crop(msg, width - x), ''  # first word is longer than the line
+        if draw_msg:
+          msg = msg[len(draw_msg):]
+        else:
+          draw_msg, msg = str_tools.crop(msg, width - x), ''  # first word is longer than the line
 
-      x = self.addstr(y, x, draw_msg, *attr)
+      # advance past the message even if it's off-screen so our wrapping
+      # doesn't depend on where we're scrolled to
+
+      self.addstr(y, x, draw_msg, *attr)
+      x += len(draw_msg)
 
       if (y - orig_y + 1) >= CONFIG['features.maxLineWrap']:
         break  # maximum number we'll wrap
@@ -595,16 +608,31 @@ class DaemonPanel(Panel, threading.Thread):
     last_ran = -1
 
     while not self._halt:
-      if self.is_paused() or (time.time() - last_ran) < self._update_rate:
-        with self._pause_condition:
-          if not self._halt:
-            self._pause_condition.wait(0.2)
-
-        continue  # done waiting, try again
+      with self._pause_condition:
+        # Wait until our next update is due. If paused then set_paused() wakes
+        # us when we should resume. This is checked while holding the
+        # condition so its notification can't slip by before we wait.
+
+        time_since_last_ran = time.time() - last_ran
+
+        if self._halt:
+          break
+        elif self.is_paused():
+          self._pause_condition.wait(self._update_rate)
+          continue
+        elif time_since_last_ran < self._update_rate:
+          self._pause_condition.wait(max(0.02, self._update_rate - time_since_last_ran))
+          continue
 
       self._update()
       last_ran = time.time()
 
+  def set_paused(self, is_pause):
+    Panel.set_paused(self, is_pause)
+
+    with self._pause_condition:
+      self._pause_condition.notifyAll()
+
   def stop(self):
     """
     Halts further resolutions and terminates the thread.
@@ -39,6 +39,7 @@ UPDATE_RATE = 5  # rate in seconds at which we refresh
 
 LAST_RETRIEVED_HS_CONF = None
 LAST_RETRIEVED_CIRCUITS = None
+LAST_RETRIEVED_DIRECTORY_FINGERPRINTS = frozenset()  # relays we have built one-hop circuits to
 
 # Connection Categories:
 #   Inbound      Relay connection, coming to us.
@@ -79,6 +80,24 @@ CONFIG = conf.config_dict('nyx', {
 }, conf_handler)
 
 
+@lru_cache(maxsize = 1024)
+def _can_exit_to(exit_policy, address, port):
+  """
+  Checks if our exit policy permits a destination. Stem validates and converts
+  the address for each rule it's checked against, and we're often asked about
+  the same destination again when our connection entries are rebuilt, so we
+  cache the decision.
+
+  :param stem.exit_policy.ExitPolicy exit_policy: policy to check against
+  :param str address: destination address
+  :param int port: destination port
+
+  :returns: **True** if the policy allows exiting to this destination
+  """
+
+  return exit_policy.can_exit_to(address, port)
+
+
 class Entry(object):
   @staticmethod
   @lru_cache()
@@ -195,15 +214,14 @@ class ConnectionEntry(Entry):
     fingerprint = nyx.tracker.get_consensus_tracker().get_relay_fingerprints(self._connection.remote_address).get(self._connection.remote_port)
 
     if fingerprint and LAST_RETRIEVED_CIRCUITS:
-      for circ in LAST_RETRIEVED_CIRCUITS:
-        if circ.path and len(circ.path) == 1 and circ.path[0][0] == fingerprint and circ.status == 'BUILT':
-          return Category.DIRECTORY  # one-hop circuit to retrieve directory information
+      if fingerprint in LAST_RETRIEVED_DIRECTORY_FINGERPRINTS:
+        return Category.DIRECTORY  # one-hop circuit to retrieve directory information
     else:
       # not a known relay, might be an exit connection
 
       exit_policy = controller.get_exit_policy(None)
 
-      if exit_policy and exit_policy.can_exit_to(self._connection.remote_address, self._connection.remote_port):
+      if exit_policy and _can_exit_to(exit_policy, self._connection.remote_address, self._connection.remote_port):
         return Category.EXIT
 
     return Category.OUTBOUND
@@ -601,11 +619,7 @@ class ConnectionPanel(nyx.panel.DaemonPanel):
     Fetches the newest resolved connections.
     """
 
-    global LAST_RETRIEVED_CIRCUITS, LAST_RETRIEVED_HS_CONF
-
-    controller = tor_controller()
-    LAST_RETRIEVED_CIRCUITS = controller.get_circuits([])
-    LAST_RETRIEVED_HS_CONF = controller.get_hidden_service_conf({})
+    global LAST_RETRIEVED_CIRCUITS, LAST_RETRIEVED_DIRECTORY_FINGERPRINTS, LAST_RETRIEVED_HS_CONF
 
     conn_resolver = nyx.tracker.get_connection_tracker()
     current_resolution_count = conn_resolver.run_counter()
@@ -615,6 +629,18 @@ class ConnectionPanel(nyx.panel.DaemonPanel):
     elif current_resolution_count == self._last_resource_fetch:
       return  # no new connections to process
 
+    # circuits and hidden services are only used to categorize new entries, so
+    # only fetched when we have some
+
+    controller = tor_controller()
+    LAST_RETRIEVED_CIRCUITS = controller.get_circuits([])
+    LAST_RETRIEVED_HS_CONF = controller.get_hidden_service_conf({})
+
+    # Every connection entry checks if it's to one of these, so we gather them
+    # up front rather than scanning our circuits for each of them.
+
+    LAST_RETRIEVED_DIRECTORY_FINGERPRINTS = frozenset([circ.path[0][0] for circ in LAST_RETRIEVED_CIRCUITS if circ.path and len(circ.path) == 1 and circ.status == 'BUILT'])
+
     new_entries = [Entry.from_connection(conn) for conn in conn_resolver.get_value()]
 
     for circ in LAST_RETRIEVED_CIRCUITS:
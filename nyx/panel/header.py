@@ -27,6 +27,12 @@ from nyx import msg, tor_controller
 
 from nyx.curses import RED, GREEN, YELLOW, CYAN, WHITE, BOLD, HIGHLIGHT
 
+try:
+  # added in python 3.2
+  from functools import lru_cache
+except ImportError:
+  from stem.util.lru_cache import lru_cache
+
 MIN_DUAL_COL_WIDTH = 141  # minimum width where we'll show two columns
 SHOW_FD_THRESHOLD = 60  # show file descriptor usage if usage is over this percentage
 UPDATE_RATE = 5  # rate in seconds at which we refresh
@@ -148,7 +154,7 @@ class HeaderPanel(nyx.panel.DaemonPanel):
 
     # space available for content
 
-    left_width = max(subwindow.width / 2, 77) if is_wide else subwindow.width
+    left_width = max(subwindow.width // 2, 77) if is_wide else subwindow.width
     right_width = subwindow.width - left_width
     pause_time = self.get_pause_time() if self.is_paused() else None
 
@@ -198,10 +204,12 @@ class HeaderPanel(nyx.panel.DaemonPanel):
         log.log_once('fd_used_at_sixty_percent', log.NOTICE, log_msg)
 
     if self._vals.is_connected:
-      if not self._reported_inactive and (time.time() - self._vals.last_heartbeat) >= 10:
+      heartbeat_age = self._vals.retrieved - self._vals.last_heartbeat
+
+      if not self._reported_inactive and heartbeat_age >= 10:
         self._reported_inactive = True
         log.notice('Relay unresponsive (last heartbeat: %s)' % time.ctime(self._vals.last_heartbeat))
-      elif self._reported_inactive and (time.time() - self._vals.last_heartbeat) < 10:
+      elif self._reported_inactive and heartbeat_age < 10:
         self._reported_inactive = False
         log.notice('Relay resumed')
 
@@ -219,8 +227,23 @@ class Sampling(object):
   def create(last_sampling = None):
     controller = tor_controller()
     retrieved = time.time()
+    connection_time = controller.connection_time()
+
+    # Tor's pid is cached by stem once found, but failed lookups fall back to
+    # commands like pgrep and netstat. If we couldn't resolve it then don't
+    # retry until we reconnect. Likewise, tor's start time only changes with
+    # its pid.
+
+    if last_sampling and not last_sampling.pid and last_sampling.connection_time == connection_time:
+      pid = last_sampling.pid
+    else:
+      pid = controller.get_pid('')
+
+    if last_sampling and last_sampling.pid == pid and last_sampling.start_time:
+      start_time = last_sampling.start_time
+    else:
+      start_time = stem.util.system.start_time(pid)
 
-    pid = controller.get_pid('')
     tor_resources = nyx.tracker.get_resource_tracker().get_value()
     nyx_total_cpu_time = sum(os.times()[:3], stem.util.system.SYSTEM_CALL_TIME)
 
@@ -246,10 +269,18 @@ class Sampling(object):
     else:
       nyx_cpu = 0.0
 
+    # our hostname and platform don't change while we're running
+
+    if last_sampling:
+      hostname, platform = last_sampling.hostname, last_sampling.platform
+    else:
+      uname = os.uname()
+      hostname, platform = uname[1], '%s %s' % (uname[0], uname[2])  # [platform name] [version]
+
     attr = {
       'retrieved': retrieved,
       'is_connected': controller.is_alive(),
-      'connection_time': controller.connection_time(),
+      'connection_time': connection_time,
       'last_heartbeat': controller.get_latest_heartbeat(),
 
       'fingerprint': controller.get_info('fingerprint', 'Unknown'),
@@ -270,7 +301,7 @@ class Sampling(object):
 
       'auth_type': auth_type,
       'pid': pid,
-      'start_time': stem.util.system.start_time(pid),
+      'start_time': start_time,
       'fd_limit': int(controller.get_info('process/descriptor-limit', '-1')),
       'fd_used': fd_used,
 
@@ -280,8 +311,8 @@ class Sampling(object):
       'memory': stem.util.str_tools.size_label(tor_resources.memory_bytes) if tor_resources.memory_bytes > 0 else 0,
       'memory_percent': '%0.1f' % (100 * tor_resources.memory_percent),
 
-      'hostname': os.uname()[1],
-      'platform': '%s %s' % (os.uname()[0], os.uname()[2]),  # [platform name] [version]
+      'hostname': hostname,
+      'platform': platform,
     }
 
     return Sampling(**attr)
@@ -462,11 +493,10 @@ def _draw_exit_policy(subwindow, x, y, exit_policy):
   if not exit_policy:
     return
 
-  rules = list(exit_policy.strip_private().strip_default())
+  rules = _exit_policy_rules(exit_policy)
 
-  for i, rule in enumerate(rules):
-    policy_color = GREEN if rule.is_accept else RED
-    x = subwindow.addstr(x, y, str(rule), policy_color, BOLD)
+  for i, (rule_label, policy_color) in enumerate(rules):
+    x = subwindow.addstr(x, y, rule_label, policy_color, BOLD)
 
     if i < len(rules) - 1:
       x = subwindow.addstr(x, y, ', ')
@@ -478,6 +508,17 @@ def _draw_exit_policy(subwindow, x, y, exit_policy):
     subwindow.addstr(x, y, '<default>', CYAN, BOLD)
 
 
+@lru_cache()
+def _exit_policy_rules(exit_policy):
+  """
+  Provides the (label, color) tuples for the rules we display of an exit
+  policy. Policies seldom change so this is cached rather than stripping and
+  formatting the policy with each redraw.
+  """
+
+  return tuple([(str(rule), GREEN if rule.is_accept else RED) for rule in exit_policy.strip_private().strip_default()])
+
+
 def _draw_newnym_option(subwindow, x, y, newnym_wait):
   """
   Provide a notice for requiesting a new identity, and time until it's next
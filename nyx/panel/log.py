@@ -242,7 +242,7 @@ class LogPanel(nyx.panel.DaemonPanel):
     if is_pause:
       self._event_log_paused = self._event_log.clone()
 
-    nyx.panel.Panel.set_paused(self, is_pause)
+    nyx.panel.DaemonPanel.set_paused(self, is_pause)
 
   def draw(self, width, height):
     scroll = self._scroller.location(self._last_content_height, height)
@@ -5,7 +5,9 @@
 Panel displaying the torrc or nyxrc with the validation done against it.
 """
 
+import bisect
 import math
+import re
 import string
 
 import nyx.curses
@@ -16,6 +18,8 @@ from nyx import expand_path, msg, panel, tor_controller
 from stem import ControllerError
 from stem.control import State
 
+NON_PRINTABLE = re.compile('[^%s]' % re.escape(string.printable))
+
 
 class TorrcPanel(panel.Panel):
   """
@@ -34,6 +38,9 @@ class TorrcPanel(panel.Panel):
     self._torrc_location = None
     self._torrc_content = None
     self._torrc_load_error = None
+    self._parsed_lines = None  # (line number label, option, argument, comment) tuples we display
+    self._line_number_width = 1  # characters needed for our largest line number
+    self._line_offsets = None  # (parsed lines, layout, line starts, content height) of our last full draw
 
     controller = tor_controller()
     controller.add_status_listener(self.reset_listener)
@@ -52,7 +59,10 @@ class TorrcPanel(panel.Panel):
         with open(self._torrc_location) as torrc_file:
           for line in torrc_file.readlines():
             line = line.replace('\t', '   ').replace('\xc2', "'").rstrip()
-            contents.append(filter(lambda char: char in string.printable, line))
+            contents.append(NON_PRINTABLE.sub('', line))
+
+        if contents == self._torrc_content:
+          return  # torrc is unchanged, so our parsed content is still valid
 
         self._torrc_content = contents
       except ControllerError as exc:
@@ -63,6 +73,8 @@ class TorrcPanel(panel.Panel):
         self._torrc_load_error = msg('panel.torrc.unable_to_load_torrc', error = exc.strerror)
         self._torrc_content = None
 
+      self._reparse()
+
   def set_comments_visible(self, is_visible):
     """
     Sets if comments and blank lines are shown or stripped.
@@ -70,8 +82,10 @@ class TorrcPanel(panel.Panel):
     :var bool is_visible: shows comments if true, strips otherwise
     """
 
-    self._show_comments = is_visible
-    self.redraw(True)
+    if self._show_comments != is_visible:
+      self._show_comments = is_visible
+      self._reparse()
+      self.redraw(True)
 
   def set_line_number_visible(self, is_visible):
     """
@@ -80,8 +94,57 @@ class TorrcPanel(panel.Panel):
     :var bool is_visible: displays line numbers if true, hides otherwise
     """
 
-    self._show_line_numbers = is_visible
-    self.redraw(True)
+    if self._show_line_numbers != is_visible:
+      self._show_line_numbers = is_visible
+      self.redraw(True)
+
+  def _reparse(self):
+    """
+    Splits the lines of our torrc into the components we display. This is done
+    when the torrc is loaded or comment visibility changes rather than with
+    each redraw.
+    """
+
+    if self._torrc_content is None:
+      self._parsed_lines = None
+      return
+
+    if self._torrc_content:
+      line_number_width = int(math.log10(len(self._torrc_content))) + 1
+    else:
+      line_number_width = 1
+
+    parsed_lines = []
+    is_multiline = False  # true if we're in the middle of a multiline torrc entry
+
+    for line_number, line in enumerate(self._torrc_content):
+      if not self._show_comments:
+        line = line[:line.find('#')].rstrip() if '#' in line else line
+
+        if not line:
+          continue  # skip blank lines
+
+      if '#' in line:
+        line, comment = line.split('#', 1)
+        comment = '#' + comment
+      else:
+        comment = ''
+
+      if is_multiline:
+        option, argument = '', line  # previous line ended with a '\'
+      elif ' ' not in line.strip():
+        option, argument = line, ''  # no argument
+      else:
+        whitespace = ' ' * (len(line) - len(line.lstrip()))
+        option, argument = line.strip().split(' ', 1)
+        option = whitespace + option + ' '
+
+      is_multiline = line.endswith('\\')  # next line's part of a multi-line entry
+      line_number_label = str(line_number + 1).rjust(line_number_width)
+      parsed_lines.append((line_number_label, option, argument, comment))
+
+    self._line_number_width = line_number_width
+    self._parsed_lines = parsed_lines
 
   def key_handlers(self):
     def _scroll(key):
@@ -105,17 +168,13 @@ class TorrcPanel(panel.Panel):
 
   def draw(self, width, height):
     scroll = self._scroller.location(self._last_content_height, height)
+    parsed_lines = self._parsed_lines
 
-    if self._torrc_content is None:
+    if parsed_lines is None:
       self.addstr(1, 0, self._torrc_load_error, RED, BOLD)
       new_content_height = 1
     else:
-      if not self._show_line_numbers:
-        line_number_offset = 0
-      elif len(self._torrc_content) == 0:
-        line_number_offset = 2
-      else:
-        line_number_offset = int(math.log10(len(self._torrc_content))) + 2
+      line_number_offset = self._line_number_width + 1 if self._show_line_numbers else 0
 
       scroll_offset = 0
 
@@ -123,38 +182,34 @@ class TorrcPanel(panel.Panel):
         scroll_offset = 3
         self.add_scroll_bar(scroll, scroll + height - 1, self._last_content_height, 1)
 
-      y = 1 - scroll
-      is_multiline = False  # true if we're in the middle of a multiline torrc entry
+      min_x = line_number_offset + scroll_offset
+      layout = (width, min_x)
+      line_offsets = self._line_offsets
 
-      for line_number, line in enumerate(self._torrc_content):
-        if not self._show_comments:
-          line = line[:line.find('#')].rstrip() if '#' in line else line
+      if parsed_lines and line_offsets and line_offsets[0] is parsed_lines and line_offsets[1] == layout:
+        # We know where each line began when last drawn with this layout, so
+        # we can skip to what's visible rather than wrapping the whole torrc.
 
-          if not line:
-            continue  # skip blank lines
+        line_starts, content_height = line_offsets[2], line_offsets[3]
+        first_line = max(0, bisect.bisect_right(line_starts, scroll) - 1)
+        last_line = bisect.bisect_right(line_starts, scroll + height - 2)
 
-        if '#' in line:
-          line, comment = line.split('#', 1)
-          comment = '#' + comment
-        else:
-          comment = ''
-
-        if is_multiline:
-          option, argument = '', line  # previous line ended with a '\'
-        elif ' ' not in line.strip():
-          option, argument = line, ''  # no argument
-        else:
-          whitespace = ' ' * (len(line) - len(line.strip()))
-          option, argument = line.strip().split(' ', 1)
-          option = whitespace + option + ' '
+        displayed_lines = parsed_lines[first_line:last_line]
+        y = 1 - scroll + line_starts[first_line]
+        line_starts = None
+      else:
+        displayed_lines = parsed_lines
+        y = 1 - scroll
+        line_starts = []
 
-        is_multiline = line.endswith('\\')  # next line's part of a multi-line entry
+      for line_number_label, option, argument, comment in displayed_lines:
+        if line_starts is not None:
+          line_starts.append(y + scroll - 1)
 
         if self._show_line_numbers:
-          self.addstr(y, scroll_offset, str(line_number + 1).rjust(line_number_offset - 1), YELLOW, BOLD)
+          self.addstr(y, scroll_offset, line_number_label, YELLOW, BOLD)
 
-        x = line_number_offset + scroll_offset
-        min_x = line_number_offset + scroll_offset
+        x = min_x
 
         x, y = self.addstr_wrap(y, x, option, width, min_x, GREEN, BOLD)
         x, y = self.addstr_wrap(y, x, argument, width, min_x, CYAN, BOLD)
@@ -162,7 +217,11 @@ class TorrcPanel(panel.Panel):
 
         y += 1
 
-      new_content_height = y + scroll - 1
+      if line_starts is not None:
+        content_height = y + scroll - 1
+        self._line_offsets = (parsed_lines, layout, line_starts, content_height)
+
+      new_content_height = content_height
 
     self.addstr(0, 0, ' ' * width)  # clear line
     location = ' (%s)' % self._torrc_location if self._torrc_location else ''
@@ -70,6 +70,11 @@ RESOURCE_TRACKER = None
 PORT_USAGE_TRACKER = None
 CONSENSUS_TRACKER = None
 
+# Serializes creation of the above so concurrent callers can't each make (and
+# start) their own tracker. Once created they're provided without locking.
+
+TRACKER_LOCK = threading.RLock()
+
 CustomResolver = enum.Enum(
   ('INFERENCE', 'by inference'),
 )
@@ -113,8 +118,11 @@ def get_connection_tracker():
   global CONNECTION_TRACKER
 
   if CONNECTION_TRACKER is None:
-    CONNECTION_TRACKER = ConnectionTracker(CONFIG['queries.connections.rate'])
-    CONNECTION_TRACKER.start()
+    with TRACKER_LOCK:
+      if CONNECTION_TRACKER is None:
+        tracker = ConnectionTracker(CONFIG['queries.connections.rate'])
+        tracker.start()
+        CONNECTION_TRACKER = tracker
 
   return CONNECTION_TRACKER
 
@@ -127,8 +135,11 @@ def get_resource_tracker():
   global RESOURCE_TRACKER
 
   if RESOURCE_TRACKER is None:
-    RESOURCE_TRACKER = ResourceTracker(CONFIG['queries.resources.rate'])
-    RESOURCE_TRACKER.start()
+    with TRACKER_LOCK:
+      if RESOURCE_TRACKER is None:
+        tracker = ResourceTracker(CONFIG['queries.resources.rate'])
+        tracker.start()
+        RESOURCE_TRACKER = tracker
 
   return RESOURCE_TRACKER
 
@@ -141,8 +152,11 @@ def get_port_usage_tracker():
   global PORT_USAGE_TRACKER
 
   if PORT_USAGE_TRACKER is None:
-    PORT_USAGE_TRACKER = PortUsageTracker(CONFIG['queries.port_usage.rate'])
-    PORT_USAGE_TRACKER.start()
+    with TRACKER_LOCK:
+      if PORT_USAGE_TRACKER is None:
+        tracker = PortUsageTracker(CONFIG['queries.port_usage.rate'])
+        tracker.start()
+        PORT_USAGE_TRACKER = tracker
 
   return PORT_USAGE_TRACKER
 
@@ -155,7 +169,9 @@ def get_consensus_tracker():
   global CONSENSUS_TRACKER
 
   if CONSENSUS_TRACKER is None:
-    CONSENSUS_TRACKER = ConsensusTracker()
+    with TRACKER_LOCK:
+      if CONSENSUS_TRACKER is None:
+        CONSENSUS_TRACKER = ConsensusTracker()
 
   return CONSENSUS_TRACKER
 
@@ -387,14 +403,19 @@ class Daemon(threading.Thread):
 
         continue  # done waiting, try again
 
+      # Resolution can take a while on busy relays so only hold our lock long
+      # enough to get the process we're tracking.
+
       with self._process_lock:
-        if self._process_pid is not None:
-          is_successful = self._task(self._process_pid, self._process_name)
-        else:
-          is_successful = False
+        process_pid, process_name = self._process_pid, self._process_name
+
+      if process_pid is not None:
+        is_successful = self._task(process_pid, process_name)
+      else:
+        is_successful = False
 
-        if is_successful:
-          self._run_counter += 1
+      if is_successful:
+        self._run_counter += 1
 
       self._last_ran = time.time()
 
@@ -812,15 +833,44 @@ class ConsensusTracker(object):
   """
 
   def __init__(self):
-    self._fingerprint_cache = {}  # {address => [(port, fingerprint), ..]} for relays
+    self._fingerprint_cache = {}  # {address => {port => fingerprint}} for relays
     self._nickname_cache = {}  # fingerprint => nickname lookup cache
     self._address_cache = {}
+    self._lacks_fingerprint = False  # tor didn't have a fingerprint when last asked
 
-    tor_controller().add_event_listener(self._new_consensus_event, stem.control.EventType.NEWCONSENSUS)
+    controller = tor_controller()
+    controller.add_event_listener(self._new_consensus_event, stem.control.EventType.NEWCONSENSUS)
+    controller.add_event_listener(self._conf_changed_event, stem.control.EventType.CONF_CHANGED)
+    controller.add_status_listener(self._tor_status_listener)
 
   def _new_consensus_event(self, event):
     self.update(event.desc)
 
+  def _conf_changed_event(self, event):
+    self._lacks_fingerprint = False  # we might have become a relay
+
+  def _tor_status_listener(self, controller, event_type, _):
+    self._lacks_fingerprint = False  # we might now be attached to a different tor process
+
+  def _get_my_fingerprint(self):
+    """
+    Provides the fingerprint of the relay we're attached to. Stem caches this
+    once we have one, but not its absence, so we remember if we're a client
+    until our configuration or connection changes.
+
+    :returns: **str** with our fingerprint, **None** if we aren't a relay
+    """
+
+    if self._lacks_fingerprint:
+      return None
+
+    fingerprint = tor_controller().get_info('fingerprint', None)
+
+    if not fingerprint:
+      self._lacks_fingerprint = True
+
+    return fingerprint
+
   def update(self, router_status_entries):
     """
     Updates our cache with the given router status entries.
@@ -833,7 +883,7 @@ class ConsensusTracker(object):
     new_nickname_cache = {}
 
     for desc in router_status_entries:
-      new_fingerprint_cache.setdefault(desc.address, []).append((desc.or_port, desc.fingerprint))
+      new_fingerprint_cache.setdefault(desc.address, {})[desc.or_port] = desc.fingerprint
       new_address_cache[desc.fingerprint] = (desc.address, desc.or_port)
       new_nickname_cache[desc.fingerprint] = desc.nickname if desc.nickname else 'Unnamed'
 
@@ -855,7 +905,7 @@ class ConsensusTracker(object):
 
     if not fingerprint:
       return None
-    elif fingerprint == controller.get_info('fingerprint', None):
+    elif fingerprint == self._get_my_fingerprint():
       return controller.get_conf('Nickname', 'Unnamed')
     else:
       return self._nickname_cache.get(fingerprint)
@@ -871,14 +921,18 @@ class ConsensusTracker(object):
 
     controller = tor_controller()
 
-    if address == controller.get_info('address', None):
-      fingerprint = controller.get_info('fingerprint', None)
-      ports = controller.get_ports(stem.control.Listener.OR, None)
+    # Only relays can be running at our own address. Checking our ORPorts first
+    # spares clients from asking tor for its address with every lookup.
+
+    my_or_ports = controller.get_ports(stem.control.Listener.OR, None)
+
+    if my_or_ports and address == controller.get_info('address', None):
+      fingerprint = self._get_my_fingerprint()
 
-      if fingerprint and ports:
-        return dict([(port, fingerprint) for port in ports])
+      if fingerprint:
+        return dict.fromkeys(my_or_ports, fingerprint)
 
-    return dict([(port, fp) for (port, fp) in self._fingerprint_cache.get(address, [])])
+    return dict(self._fingerprint_cache.get(address, {}))
 
   def get_relay_address(self, fingerprint, default):
     """
@@ -891,7 +945,7 @@ class ConsensusTracker(object):
 
     controller = tor_controller()
 
-    if fingerprint == controller.get_info('fingerprint', None):
+    if fingerprint == self._get_my_fingerprint():
       my_address = controller.get_info('address', None)
       my_or_ports = controller.get_ports(stem.control.Listener.OR, [])
 
@@ -17,6 +17,8 @@ __all__ = [
   'expand_path',
   'installation',
   'log',
+  'menu',
+  'subwindow',
   'tracker',
 ]
 
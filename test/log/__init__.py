@@ -4,5 +4,6 @@ Unit tests for nyx's log utilities.
 
 __all__ = [
   'deduplication',
+  'listen_for_events',
   'read_tor_log',
 ]
@@ -0,0 +1,66 @@
+import unittest
+
+import stem
+
+from nyx.log import listen_for_events
+
+from mock import call, patch, Mock
+
+
+class TestListenForEvents(unittest.TestCase):
+  @patch('nyx.tor_controller')
+  def test_listen_for_events(self, tor_controller_mock):
+    controller = Mock()
+    controller.get_info.return_value = None
+    tor_controller_mock.return_value = controller
+    listener = Mock()
+
+    self.assertEqual(['BW', 'NOTICE', 'NYX_DEBUG'], listen_for_events(listener, ['BW', 'NOTICE', 'NYX_DEBUG', 'BW']))
+    controller.remove_event_listener.assert_called_once_with(listener)
+    self.assertEqual(1, controller.add_event_listener.call_count)
+
+    args = controller.add_event_listener.call_args[0]
+    self.assertEqual(listener, args[0])
+    self.assertEqual(['BW', 'NOTICE'], sorted(args[1:]))
+
+  @patch('nyx.tor_controller')
+  def test_listen_for_events_when_rejected(self, tor_controller_mock):
+    def add_event_listener(listener, *events):
+      if 'CIRC_MINOR' in events:
+        raise stem.ProtocolError('SETEVENTS rejected CIRC_MINOR')
+
+    controller = Mock()
+    controller.get_info.return_value = None
+    controller.add_event_listener.side_effect = add_event_listener
+    tor_controller_mock.return_value = controller
+    listener = Mock()
+
+    self.assertEqual(['BW'], listen_for_events(listener, ['BW', 'CIRC_MINOR']))
+    self.assertEqual([call(listener), call(listener)], controller.remove_event_listener.call_args_list)
+    # first attempt is for everything, then we go event by event
+
+    add_calls = controller.add_event_listener.call_args_list
+    self.assertEqual(3, len(add_calls))
+    self.assertEqual(['BW', 'CIRC_MINOR'], sorted(add_calls[0][0][1:]))
+    self.assertEqual([call(listener, 'BW'), call(listener, 'CIRC_MINOR')], sorted(add_calls[1:]))
+
+  @patch('nyx.tor_controller')
+  def test_listen_for_events_tor_does_not_support(self, tor_controller_mock):
+    controller = Mock()
+    controller.get_info.return_value = 'DEBUG INFO NOTICE WARN ERR BW'
+    tor_controller_mock.return_value = controller
+    listener = Mock()
+
+    self.assertEqual(['BW'], listen_for_events(listener, ['BW', 'CIRC_MINOR']))
+    controller.add_event_listener.assert_called_once_with(listener, 'BW')
+
+  @patch('nyx.tor_controller')
+  def test_listen_for_only_nyx_events(self, tor_controller_mock):
+    controller = Mock()
+    controller.get_info.return_value = 'DEBUG INFO NOTICE WARN ERR BW'
+    tor_controller_mock.return_value = controller
+    listener = Mock()
+
+    self.assertEqual(['NYX_DEBUG', 'NYX_NOTICE'], listen_for_events(listener, ['NYX_NOTICE', 'NYX_DEBUG', 'CIRC_MINOR']))
+    controller.remove_event_listener.assert_called_once_with(listener)
+    self.assertFalse(controller.add_event_listener.called)
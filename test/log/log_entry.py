@@ -25,3 +25,10 @@ class TestLogEntry(unittest.TestCase):
 
     entry = LogEntry(1333738434, 'NOTICE', 'Bootstrapped 72%: Loading relay descriptors.')
     self.assertTrue(entry.is_duplicate_of(LogEntry(1333738457, 'NOTICE', 'Bootstrapped 55%: Loading relay descriptors.')))
+
+  def test_deduplication_requires_the_same_common_message(self):
+    # both messages match something in dedup.cfg, but not the same thing
+
+    entry = LogEntry(1333738434, 'NOTICE', 'Heartbeat: Tor\'s uptime is 2 days 0:00 hours.')
+    self.assertFalse(entry.is_duplicate_of(LogEntry(1333738457, 'NOTICE', 'Average packaged cell fullness: 89.471%')))
+    self.assertTrue(entry.is_duplicate_of(LogEntry(1333738457, 'NOTICE', 'Heartbeat: Tor\'s uptime is 3 days 0:00 hours.')))
@@ -0,0 +1,137 @@
+"""
+Unit tests for nyx.menu.
+"""
+
+import unittest
+
+import nyx.curses
+import test
+
+from nyx.menu import MenuItem, Submenu, _draw_selection_change
+from test import require_curses
+
+from mock import patch, Mock
+
+
+class TestMenu(unittest.TestCase):
+  def test_add(self):
+    menu = Submenu('File')
+    item = MenuItem('Exit', None)
+    menu.add(item)
+
+    self.assertEqual([item], menu.get_children())
+    self.assertEqual(menu, item.get_parent())
+    self.assertRaises(ValueError, menu.add, item)
+
+  def test_add_lazy(self):
+    def make_graph_menu():
+      graph_menu = Submenu('Graph')
+      graph_menu.add(MenuItem('Resize...', None))
+      graph_menu.add(Submenu('Interval'))
+      return graph_menu
+
+    factory = Mock(side_effect = make_graph_menu)
+
+    base_menu = Submenu('')
+    graph_menu = base_menu.add_lazy('Graph', factory)
+
+    self.assertEqual(('', 'Graph', ' >'), graph_menu.get_label())
+    self.assertEqual(base_menu, graph_menu.get_parent())
+    self.assertFalse(factory.called)
+
+    children = graph_menu.get_children()
+
+    self.assertEqual(['Resize...', 'Interval'], [str(child) for child in children])
+    self.assertEqual([graph_menu, graph_menu], [child.get_parent() for child in children])
+    self.assertEqual([base_menu, graph_menu, children[1]], children[1].get_hierarchy())
+
+    # contents are only constructed once
+
+    graph_menu.get_children()
+    self.assertEqual(1, factory.call_count)
+
+  def test_get_hierarchy(self):
+    color_menu = _menu_with('All', 'Red')
+    red_item = color_menu.get_children()[1]
+
+    self.assertEqual([color_menu, red_item], red_item.get_hierarchy())
+    self.assertTrue(red_item.get_hierarchy() is red_item.get_hierarchy())
+
+    # hierarchy of our children changes when we're added to another menu
+
+    view_menu = Submenu('View')
+    view_menu.add(color_menu)
+
+    self.assertEqual([view_menu, color_menu, red_item], red_item.get_hierarchy())
+    self.assertEqual(view_menu, red_item.get_root())
+    self.assertEqual(view_menu, view_menu.get_root())
+
+  def test_get_layout(self):
+    menu = _menu_with('Hotkeys', 'About')
+    label_format, menu_width = menu.get_layout()
+
+    self.assertEqual(' %-0s%-7s%-0s ', label_format)
+    self.assertEqual(9, menu_width)
+    self.assertEqual(' About   ', label_format % menu.get_children()[1].get_label())
+
+    menu.add(Submenu('Interval'))
+    label_format, menu_width = menu.get_layout()
+
+    self.assertEqual(' %-0s%-8s%-2s ', label_format)
+    self.assertEqual(12, menu_width)
+
+  def test_is_empty(self):
+    self.assertTrue(Submenu('Empty').is_empty())
+    self.assertTrue(Submenu('').add_lazy('Empty', lambda: Submenu('Empty')).is_empty())
+    self.assertFalse(Submenu('').add_lazy('Help', lambda: _menu_with('Hotkeys')).is_empty())
+
+  @require_curses
+  def test_draw_selection_change(self):
+    menu = _menu_with('Hotkeys', 'Tutorial', 'About')
+    hotkeys_item, tutorial_item, about_item = menu.get_children()
+    menu._last_drawn_position = (0, 0)
+
+    def _draw():
+      nyx.curses.draw(lambda subwindow: [subwindow.addstr(0, y, 'x' * 15) for y in range(3)])
+      _draw_selection_change(menu, hotkeys_item, about_item)
+
+    self.assertEqual(' Hotkeys  xxxxx\nxxxxxxxxxxxxxxx\n About    xxxxx', test.render(_draw).content)
+
+  @patch('nyx.curses.partial_draw')
+  @patch('nyx.curses.screen_size', Mock(return_value = nyx.curses.Dimensions(80, 4)))
+  def test_draw_selection_change_below_screen(self, partial_draw_mock):
+    menu = _menu_with('5 seconds', '30 seconds', 'minutely', '15 minute')
+    items = menu.get_children()
+    menu._last_drawn_position = (1, 0)
+
+    # fourth item is on row four, below our four row screen
+
+    self.assertFalse(_draw_selection_change(menu, items[2], items[3]))
+    self.assertFalse(_draw_selection_change(menu, items[3], items[0]))
+    self.assertFalse(partial_draw_mock.called)
+
+    self.assertTrue(_draw_selection_change(menu, items[1], items[2]))
+    self.assertEqual([2, 3], [kwargs['top'] for args, kwargs in partial_draw_mock.call_args_list])
+
+  def test_siblings(self):
+    menu = _menu_with('Close Menu', 'New Identity', 'Exit')
+    close_item, newnym_item, exit_item = menu.get_children()
+
+    self.assertEqual(newnym_item, close_item.next())
+    self.assertEqual(exit_item, close_item.prev())
+    self.assertEqual(close_item, exit_item.next())
+    self.assertRaises(ValueError, menu.next)
+
+    # sibling lookups are invalid if our parent no longer lists us
+
+    menu._children.remove(newnym_item)
+    self.assertRaises(ValueError, newnym_item.next)
+
+
+def _menu_with(*labels):
+  menu = Submenu('Actions')
+
+  for label in labels:
+    menu.add(MenuItem(label, None))
+
+  return menu
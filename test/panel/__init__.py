@@ -3,5 +3,8 @@ Unit tests for nyx's panel modules.
 """
 
 __all__ = [
+  'connection',
+  'daemon',
   'header',
+  'torrc',
 ]
@@ -0,0 +1,137 @@
+"""
+Unit tests for nyx.panel.connection.
+"""
+
+import datetime
+import unittest
+
+import nyx.panel.connection
+
+from nyx.panel.connection import Category, ConnectionEntry
+from nyx.tracker import Connection
+
+from stem.exit_policy import ExitPolicy
+
+from mock import patch, Mock
+
+DIR_FINGERPRINT = '9695DFC35FFEB861329B9F1AB04C46397020CE31'
+RELAY_FINGERPRINT = '847B1F850344D7876491A54892F904934E4EB85D'
+
+
+def _circuit(circ_id, status, path):
+  return Mock(id = circ_id, status = status, path = path, created = datetime.datetime(2016, 10, 17, 20, 0))
+
+
+def _connection(remote_address = '128.31.0.34', remote_port = 9101):
+  return Connection(1476734400.0, False, '192.168.0.1', 51210, remote_address, remote_port, 'tcp', False)
+
+
+def _panel():
+  with patch('nyx.panel.connection.tor_controller') as tor_controller_mock:
+    tor_controller_mock().get_info.return_value = None
+    return nyx.panel.connection.ConnectionPanel()
+
+
+class TestConnectionPanel(unittest.TestCase):
+  @patch('nyx.panel.connection.tor_controller')
+  @patch('nyx.tracker.get_connection_tracker')
+  def test_update_when_resolver_is_not_running(self, get_connection_tracker_mock, tor_controller_mock):
+    get_connection_tracker_mock().is_alive.return_value = False
+
+    _panel()._update()
+    self.assertFalse(tor_controller_mock().get_circuits.called)
+    self.assertFalse(tor_controller_mock().get_hidden_service_conf.called)
+
+  @patch('nyx.panel.connection.tor_controller')
+  @patch('nyx.tracker.get_connection_tracker')
+  def test_update_without_new_connections(self, get_connection_tracker_mock, tor_controller_mock):
+    resolver = get_connection_tracker_mock()
+    resolver.is_alive.return_value = True
+    resolver.run_counter.return_value = 5
+
+    panel = _panel()
+    panel._last_resource_fetch = 5
+    panel._update()
+
+    self.assertFalse(tor_controller_mock().get_circuits.called)
+    self.assertFalse(tor_controller_mock().get_hidden_service_conf.called)
+
+  @patch('nyx.panel.connection.tor_controller')
+  @patch('nyx.tracker.get_connection_tracker')
+  @patch('nyx.tracker.get_port_usage_tracker', Mock())
+  @patch('nyx.panel.connection.LAST_RETRIEVED_CIRCUITS', None)
+  @patch('nyx.panel.connection.LAST_RETRIEVED_HS_CONF', None)
+  def test_update_with_new_connections(self, get_connection_tracker_mock, tor_controller_mock):
+    resolver = get_connection_tracker_mock()
+    resolver.is_alive.return_value = True
+    resolver.run_counter.return_value = 6
+    resolver.get_value.return_value = []
+
+    circuits = [Mock(status = 'BUILT', path = [('9695DFC35FFEB861329B9F1AB04C46397020CE31', 'moria1')])]
+    tor_controller_mock().get_circuits.return_value = circuits
+    tor_controller_mock().get_hidden_service_conf.return_value = {}
+
+    panel = _panel()
+    panel._update()
+
+    self.assertEqual(circuits, nyx.panel.connection.LAST_RETRIEVED_CIRCUITS)
+    self.assertEqual({}, nyx.panel.connection.LAST_RETRIEVED_HS_CONF)
+    self.assertEqual(6, panel._last_resource_fetch)
+
+  @patch('nyx.panel.connection.tor_controller')
+  @patch('nyx.tracker.get_connection_tracker')
+  @patch('nyx.tracker.get_consensus_tracker')
+  @patch('nyx.tracker.get_port_usage_tracker', Mock())
+  @patch('nyx.panel.connection.LAST_RETRIEVED_CIRCUITS', None)
+  @patch('nyx.panel.connection.LAST_RETRIEVED_HS_CONF', None)
+  @patch('nyx.panel.connection.LAST_RETRIEVED_DIRECTORY_FINGERPRINTS', frozenset())
+  def test_update_directory_fingerprints(self, get_consensus_tracker_mock, get_connection_tracker_mock, tor_controller_mock):
+    get_consensus_tracker_mock().get_relay_address.return_value = ('128.31.0.34', 9101)
+
+    resolver = get_connection_tracker_mock()
+    resolver.is_alive.return_value = True
+    resolver.run_counter.return_value = 6
+    resolver.get_value.return_value = []
+
+    tor_controller_mock().get_circuits.return_value = [
+      _circuit(1, 'BUILT', [(DIR_FINGERPRINT, 'moria1')]),
+      _circuit(2, 'LAUNCHED', [(RELAY_FINGERPRINT, 'tor26')]),
+      _circuit(3, 'BUILT', [(RELAY_FINGERPRINT, 'tor26'), (DIR_FINGERPRINT, 'moria1')]),
+    ]
+
+    tor_controller_mock().get_hidden_service_conf.return_value = {}
+
+    _panel()._update()
+    self.assertEqual(frozenset([DIR_FINGERPRINT]), nyx.panel.connection.LAST_RETRIEVED_DIRECTORY_FINGERPRINTS)
+
+
+class TestConnectionEntry(unittest.TestCase):
+  @patch('nyx.panel.connection.tor_controller')
+  @patch('nyx.tracker.get_consensus_tracker')
+  @patch('nyx.panel.connection.LAST_RETRIEVED_HS_CONF', None)
+  @patch('nyx.panel.connection.LAST_RETRIEVED_CIRCUITS', [Mock()])
+  @patch('nyx.panel.connection.LAST_RETRIEVED_DIRECTORY_FINGERPRINTS', frozenset([DIR_FINGERPRINT]))
+  def test_directory_type(self, get_consensus_tracker_mock, tor_controller_mock):
+    tor_controller_mock().get_ports.return_value = []
+
+    get_consensus_tracker_mock().get_relay_fingerprints.return_value = {9101: DIR_FINGERPRINT}
+    self.assertEqual(Category.DIRECTORY, ConnectionEntry(_connection()).get_type())
+
+    get_consensus_tracker_mock().get_relay_fingerprints.return_value = {9101: RELAY_FINGERPRINT}
+    self.assertEqual(Category.OUTBOUND, ConnectionEntry(_connection()).get_type())
+
+  @patch('nyx.panel.connection.tor_controller')
+  @patch('nyx.tracker.get_consensus_tracker')
+  @patch('nyx.panel.connection.LAST_RETRIEVED_HS_CONF', None)
+  def test_exit_type_when_policy_changes(self, get_consensus_tracker_mock, tor_controller_mock):
+    tor_controller_mock().get_ports.return_value = []
+    get_consensus_tracker_mock().get_relay_fingerprints.return_value = {}
+
+    tor_controller_mock().get_exit_policy.return_value = ExitPolicy('accept *:80', 'reject *:*')
+    self.assertEqual(Category.EXIT, ConnectionEntry(_connection('74.125.21.102', 80)).get_type())
+
+    tor_controller_mock().get_exit_policy.return_value = ExitPolicy('reject *:*')
+    self.assertEqual(Category.OUTBOUND, ConnectionEntry(_connection('74.125.21.102', 80)).get_type())
+
+    tor_controller_mock().get_exit_policy.return_value = ExitPolicy('accept *:80', 'reject *:*')
+    self.assertEqual(Category.EXIT, ConnectionEntry(_connection('74.125.21.102', 80)).get_type())
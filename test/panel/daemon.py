@@ -0,0 +1,71 @@
+"""
+Unit tests for nyx.panel.DaemonPanel.
+"""
+
+import threading
+import time
+import unittest
+
+import nyx.panel
+
+
+class CountingPanel(nyx.panel.DaemonPanel):
+  def __init__(self, update_rate):
+    nyx.panel.DaemonPanel.__init__(self, 'counting', update_rate)
+    self.updated = threading.Event()
+    self.update_count = 0
+
+  def _update(self):
+    self.update_count += 1
+    self.updated.set()
+
+
+class TestDaemonPanel(unittest.TestCase):
+  def test_pause_and_unpause(self):
+    panel = CountingPanel(60)
+    panel.set_paused(True)
+    panel.start()
+
+    try:
+      self.assertFalse(panel.updated.wait(0.1))
+      self.assertEqual(0, panel.update_count)
+
+      # our first update is due as soon as we're unpaused
+
+      start_time = time.time()
+      panel.set_paused(False)
+
+      self.assertTrue(panel.updated.wait(2))
+      self.assertTrue(time.time() - start_time < 2)
+      self.assertEqual(1, panel.update_count)
+    finally:
+      panel.stop()
+      panel.join()
+
+  def test_stop(self):
+    panel = CountingPanel(60)
+    panel.start()
+    self.assertTrue(panel.updated.wait(2))
+
+    # shouldn't need to wait for our next update
+
+    start_time = time.time()
+    panel.stop()
+    panel.join(2)
+
+    self.assertFalse(panel.is_alive())
+    self.assertTrue(time.time() - start_time < 2)
+    self.assertEqual(1, panel.update_count)
+
+  def test_stop_while_paused(self):
+    panel = CountingPanel(60)
+    panel.set_paused(True)
+    panel.start()
+
+    start_time = time.time()
+    panel.stop()
+    panel.join(2)
+
+    self.assertFalse(panel.is_alive())
+    self.assertTrue(time.time() - start_time < 2)
+    self.assertEqual(0, panel.update_count)
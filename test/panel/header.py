@@ -156,6 +156,46 @@ class TestHeader(unittest.TestCase):
     self.assertEqual('odin', vals.hostname)
     self.assertEqual('Linux 3.5.0-54-generic', vals.platform)
 
+  @patch('nyx.panel.header.tor_controller')
+  @patch('nyx.tracker.get_resource_tracker')
+  @patch('os.uname', Mock(return_value = ('Linux', 'odin', '3.5.0-54-generic', '#81~precise1-Ubuntu SMP Tue Jul 15 04:05:58 UTC 2014', 'i686')))
+  @patch('stem.util.proc.file_descriptors_used', Mock(side_effect = IOError()))
+  @patch('stem.util.system.start_time')
+  def test_sample_reuses_pid_lookups(self, start_time_mock, resource_tracker_mock, tor_controller_mock):
+    tor_controller_mock().get_pid.return_value = ''
+    tor_controller_mock().get_info.return_value = '-1'
+    tor_controller_mock().get_listeners.return_value = []
+    tor_controller_mock().connection_time.return_value = 567.8
+    start_time_mock.return_value = 5678
+
+    resources = Mock()
+    resources.cpu_sample = 6.7
+    resources.memory_bytes = 62464
+    resources.memory_percent = .125
+
+    resource_tracker_mock().get_value.return_value = resources
+
+    # failed pid lookups aren't retried until we reconnect
+
+    vals = nyx.panel.header.Sampling.create()
+    vals = nyx.panel.header.Sampling.create(vals)
+    self.assertEqual(1, tor_controller_mock().get_pid.call_count)
+
+    tor_controller_mock().get_pid.return_value = '123'
+    tor_controller_mock().connection_time.return_value = 678.9
+
+    vals = nyx.panel.header.Sampling.create(vals)
+    self.assertEqual(2, tor_controller_mock().get_pid.call_count)
+    self.assertEqual('123', vals.pid)
+
+    # start time is only looked up when the pid changes
+
+    start_time_mock.reset_mock()
+    vals = nyx.panel.header.Sampling.create(vals)
+
+    self.assertEqual(5678, vals.start_time)
+    self.assertFalse(start_time_mock.called)
+
   def test_sample_format(self):
     vals = nyx.panel.header.Sampling(
       version = '0.2.8.1',
@@ -0,0 +1,114 @@
+"""
+Unit tests for nyx.panel.torrc.
+"""
+
+import unittest
+
+import nyx.panel.torrc
+
+from mock import patch, mock_open, Mock
+from stem.control import State
+
+TORRC = """
+# configuration for my relay
+ORPort 9050  # relaying traffic
+  ExitPolicy accept *:80, \\
+    reject *:*  # no other exiting
+
+Nickname\tUnnamed\x07
+""".lstrip()
+
+LONG_TORRC = '\n'.join([
+  '# %s' % ' '.join(['comment'] * (i % 7)) if i % 3 == 0 else 'ContactInfo %s  # %s' % (' '.join(['address'] * (i % 5)), 'note ' * (i % 4))
+  for i in range(40)
+])
+
+
+def _draw(panel, width, height):
+  """
+  Draws the panel, providing the rows it rendered.
+  """
+
+  rows = [[' '] * width for i in range(height)]
+
+  def addstr(y, x, msg, attr):
+    if 0 <= y < height:
+      for i, char in enumerate(msg[:width - x]):
+        rows[y][x + i] = char
+
+  panel.win = Mock()
+  panel.win.addstr.side_effect = addstr
+  panel.max_y, panel.max_x = height, width
+  panel.draw(width, height)
+
+  return [''.join(row).rstrip() for row in rows]
+
+
+class TestTorrc(unittest.TestCase):
+  @patch('nyx.panel.torrc.tor_controller')
+  @patch('nyx.panel.torrc.expand_path', lambda path: path)
+  @patch('nyx.panel.torrc.open', mock_open(read_data = TORRC), create = True)
+  def test_parsing(self, tor_controller_mock):
+    tor_controller_mock().get_info.return_value = '/path/to/torrc'
+    panel = nyx.panel.torrc.TorrcPanel()
+
+    self.assertEqual([
+      ('1', '', '', '# configuration for my relay'),
+      ('2', 'ORPort ', '9050', '# relaying traffic'),
+      ('3', '  ExitPolicy ', 'accept *:80, \\', ''),
+      ('4', '', '    reject *:*  ', '# no other exiting'),
+      ('5', '', '', ''),
+      ('6', 'Nickname ', '  Unnamed', ''),
+    ], panel._parsed_lines)
+    self.assertEqual(1, panel._line_number_width)
+
+    panel.redraw = lambda force_redraw = False: None
+    panel.set_comments_visible(False)
+
+    self.assertEqual([
+      ('2', 'ORPort ', '9050', ''),
+      ('3', '  ExitPolicy ', 'accept *:80, \\', ''),
+      ('4', '', '    reject *:*', ''),
+      ('6', 'Nickname ', '  Unnamed', ''),
+    ], panel._parsed_lines)
+
+  @patch('nyx.panel.torrc.tor_controller')
+  @patch('nyx.panel.torrc.expand_path', lambda path: path)
+  @patch('nyx.panel.torrc.open', mock_open(read_data = TORRC), create = True)
+  def test_unchanged_settings(self, tor_controller_mock):
+    tor_controller_mock().get_info.return_value = '/path/to/torrc'
+    panel = nyx.panel.torrc.TorrcPanel()
+    panel.redraw = Mock()
+    parsed_lines = panel._parsed_lines
+
+    panel.set_comments_visible(True)
+    panel.set_line_number_visible(True)
+    panel.reset_listener(tor_controller_mock(), State.RESET, None)
+
+    self.assertFalse(panel.redraw.called)
+    self.assertTrue(parsed_lines is panel._parsed_lines)
+
+  @patch('nyx.panel.torrc.tor_controller')
+  @patch('nyx.panel.torrc.expand_path', lambda path: path)
+  @patch('nyx.panel.torrc.open', mock_open(read_data = LONG_TORRC), create = True)
+  @patch('nyx.curses.curses_attr', Mock(return_value = 0))
+  @patch('nyx.panel.Panel.add_scroll_bar', Mock())
+  def test_scrolling_wrapped_lines(self, tor_controller_mock):
+    tor_controller_mock().get_info.return_value = '/path/to/torrc'
+    height = 10
+
+    for width in (30, 50, 80):
+      panel = nyx.panel.torrc.TorrcPanel()
+      panel.redraw = lambda force_redraw = False: None
+
+      _draw(panel, width, height)
+      _draw(panel, width, height)  # first draw determines if we need a scrollbar
+
+      for scroll in range(panel._last_content_height - height + 2):
+        panel._scroller._location = scroll
+        rendered = _draw(panel, width, height)
+        content_height = panel._last_content_height
+
+        panel._line_offsets = None
+        self.assertEqual(_draw(panel, width, height), rendered)
+        self.assertEqual(panel._last_content_height, content_height)
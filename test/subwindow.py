@@ -0,0 +1,27 @@
+"""
+Unit tests for nyx.curses' subwindows.
+"""
+
+import unittest
+
+import test
+
+from test import require_curses
+
+EXPECTED_WRAPPED = """
+This is a
+ message that
+ wraps on word
+ breaks.
+Areallyreal...
+""".strip()
+
+
+class TestSubwindow(unittest.TestCase):
+  @require_curses
+  def test_addstr_wrap(self):
+    def _draw(subwindow):
+      x, y = subwindow.addstr_wrap(0, 0, 'This is a message that wraps on word breaks.', 14)
+      subwindow.addstr_wrap(0, y + 1, 'Areallyreallyreallylongword', 14)
+
+    self.assertEqual(EXPECTED_WRAPPED, test.render(_draw).content)
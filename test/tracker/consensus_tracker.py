@@ -0,0 +1,84 @@
+import unittest
+
+import stem.control
+
+from nyx.tracker import ConsensusTracker
+
+from mock import Mock, patch
+
+MY_FINGERPRINT = '29787760145CD1A473552A2FC64C72A9A130820E'
+
+
+def _router_status_entry(fingerprint, nickname, address, or_port):
+  return Mock(fingerprint = fingerprint, nickname = nickname, address = address, or_port = or_port)
+
+
+class TestConsensusTracker(unittest.TestCase):
+  @patch('nyx.tracker.tor_controller')
+  def test_relay_lookups(self, tor_controller_mock):
+    tor_controller_mock().get_info.return_value = None  # not a relay
+
+    tracker = ConsensusTracker()
+    tracker.update([
+      _router_status_entry('9695DFC35FFEB861329B9F1AB04C46397020CE31', 'moria1', '128.31.0.34', 9101),
+      _router_status_entry('847B1F850344D7876491A54892F904934E4EB85D', None, '86.59.21.38', 443),
+    ])
+
+    self.assertEqual('moria1', tracker.get_relay_nickname('9695DFC35FFEB861329B9F1AB04C46397020CE31'))
+    self.assertEqual('Unnamed', tracker.get_relay_nickname('847B1F850344D7876491A54892F904934E4EB85D'))
+    self.assertEqual(None, tracker.get_relay_nickname(MY_FINGERPRINT))
+
+    self.assertEqual({9101: '9695DFC35FFEB861329B9F1AB04C46397020CE31'}, tracker.get_relay_fingerprints('128.31.0.34'))
+    self.assertEqual({}, tracker.get_relay_fingerprints('127.0.0.1'))
+
+    self.assertEqual(('86.59.21.38', 443), tracker.get_relay_address('847B1F850344D7876491A54892F904934E4EB85D', None))
+    self.assertEqual(None, tracker.get_relay_address(MY_FINGERPRINT, None))
+
+  @patch('nyx.tracker.tor_controller')
+  def test_relay_fingerprints_at_our_address(self, tor_controller_mock):
+    controller = tor_controller_mock()
+    controller.get_info.side_effect = lambda param, default: {'address': '74.125.21.102', 'fingerprint': MY_FINGERPRINT}[param]
+    controller.get_ports.return_value = [9050, 9051]
+
+    tracker = ConsensusTracker()
+    self.assertEqual({9050: MY_FINGERPRINT, 9051: MY_FINGERPRINT}, tracker.get_relay_fingerprints('74.125.21.102'))
+
+    # clients don't need to ask tor for its address
+
+    controller.get_info.reset_mock()
+    controller.get_ports.return_value = []
+
+    self.assertEqual({}, tracker.get_relay_fingerprints('74.125.21.102'))
+    self.assertFalse(controller.get_info.called)
+
+  @patch('nyx.tracker.tor_controller')
+  def test_missing_fingerprint_is_cached(self, tor_controller_mock):
+    controller = tor_controller_mock()
+    controller.get_info.return_value = None  # clients don't have a fingerprint
+
+    tracker = ConsensusTracker()
+
+    for i in range(5):
+      self.assertEqual(None, tracker.get_relay_nickname(MY_FINGERPRINT))
+
+    controller.get_info.assert_called_once_with('fingerprint', None)
+
+    # setting an ORPort would make us a relay
+
+    tracker._conf_changed_event(Mock())
+    controller.get_info.return_value = MY_FINGERPRINT
+    controller.get_conf.return_value = 'Unnamed'
+
+    self.assertEqual('Unnamed', tracker.get_relay_nickname(MY_FINGERPRINT))
+    self.assertEqual('Unnamed', tracker.get_relay_nickname(MY_FINGERPRINT))
+    self.assertEqual(3, controller.get_info.call_count)  # stem caches our actual fingerprint
+
+    # as would reconnecting to a different tor process
+
+    controller.get_info.return_value = None
+    self.assertEqual(None, tracker.get_relay_nickname(MY_FINGERPRINT))
+
+    tracker._tor_status_listener(controller, stem.control.State.INIT, None)
+    controller.get_info.return_value = MY_FINGERPRINT
+
+    self.assertEqual('Unnamed', tracker.get_relay_nickname(MY_FINGERPRINT))